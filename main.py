@@ -5,6 +5,8 @@ from methods.dijkstra import dijkstra, dijkstra_with_table
 from methods.bfs import bfs
 from methods.dfs import dfs
 from methods.degree import show_graph_degree, show_all_analytics
+from methods.k_shortest import k_shortest_paths, start_spur_pool
+from methods.reachability import build_reachability_index, is_index_stale, can_reach
 
 def wait_for_user():
     input("\nPress 'Enter' to continue...")
@@ -20,17 +22,34 @@ class Graf:
         else:
             self.graph = nx.Graph()
             self.is_directed = False
+        # Reachability index for directed graphs, built lazily on first query
+        self._reachability = None
+        # Shortest-path trees shared between k-shortest-paths queries
+        self._path_cache = {}
+        self._path_cache_nodes = None
+        # Worker processes for spur searches, kept while the graph is unchanged
+        self._spur_pool = None
+        self._spur_pool_workers = None
+
+    def invalidate_caches(self):
+        """Drop cached search state; call this after editing self.graph directly"""
+        self._reachability = None
+        self._path_cache = {}
+        self._close_spur_pool()
+
+    def _close_spur_pool(self):
+        if self._spur_pool is not None:
+            self._spur_pool.shutdown(wait=False)
+            self._spur_pool = None
 
     # Add node to the graph
     def add_node(self, node):
         self.graph.add_node(node)
+        self.invalidate_caches()
 
     # Add edge with optional weight
     def add_edge(self, node1, node2, weight=None):
-        if weight is not None:
-            self.graph.add_edge(node1, node2, weight=weight)
-        else:
-            self.graph.add_edge(node1, node2)
+        self._insert_edge(node1, node2, weight)
     
     def add_directed_edge(self, from_node, to_node, weight=None):
         """Add a directed edge (only works if graph is directed)"""
@@ -38,12 +57,55 @@ class Graf:
             print("Warning: This is an undirected graph. Use add_edge() instead.")
             return
         
+        self._insert_edge(from_node, to_node, weight)
+
+    def _insert_edge(self, node1, node2, weight=None):
+        """Add an edge and keep the cached search state in sync with the graph"""
+        # On a directed graph, an edge between nodes that are already connected keeps the index valid
+        index = self._reachability
+        keep_index = (self.is_directed
+                      and not is_index_stale(index, self.graph)
+                      and can_reach(index, node1, node2))
+        
         if weight is not None:
-            self.graph.add_edge(from_node, to_node, weight=weight)
+            self.graph.add_edge(node1, node2, weight=weight)
         else:
-            self.graph.add_edge(from_node, to_node)
+            self.graph.add_edge(node1, node2)
+        
+        if keep_index:
+            self._path_cache = {}
+            self._close_spur_pool()
+        else:
+            self.invalidate_caches()
+
+    def has_path(self, start, end):
+        """Check if end is reachable from start (uses the reachability index on directed graphs)"""
+        if start not in self.graph.nodes() or end not in self.graph.nodes():
+            return False
+        if not self.is_directed:
+            return nx.has_path(self.graph, start, end)
+        if is_index_stale(self._reachability, self.graph):
+            self._reachability = build_reachability_index(self.graph)
+        return can_reach(self._reachability, start, end)
+
+    def _known_no_path(self, start, end):
+        """Return True if the index proves there is no path, so the search can be skipped"""
+        if not self.is_directed:
+            return False
+        if start not in self.graph.nodes() or end not in self.graph.nodes():
+            return False
+        return not self.has_path(start, end)
+
+    def _print_skipped_search(self, start):
+        """Print the verbose no-path summary of a search that stops at the start node"""
+        print(f"\n✗ No path found")
+        print(f"Total nodes visited: 1")
+        print(f"Nodes visited: {start}")
 
     def shortest_path(self, start, end):
+        if self._known_no_path(start, end):
+            print(f"No path exists between {start} and {end}")
+            return None, None
         try:
             path = nx.shortest_path(self.graph, start, end, weight='weight')
             length = nx.shortest_path_length(self.graph, start, end, weight='weight')
@@ -56,20 +118,54 @@ class Graf:
 
     def dijkstra(self, start, end):
         """Use external Dijkstra implementation"""
+        if self._known_no_path(start, end):
+            print(f"No path exists between {start} and {end}")
+            return None, None
         return dijkstra(self.graph, start, end)
     
     def dijkstra_with_table(self, start, end):
         """Use external Dijkstra implementation with table"""
+        if self._known_no_path(start, end):
+            print(f"No path from {start} to {end}")
+            return None, None
         return dijkstra_with_table(self.graph, start, end)
 
     def bfs(self, start, end, verbose=False):
         """Use external BFS implementation"""
+        if self._known_no_path(start, end):
+            if verbose:
+                self._print_skipped_search(start)
+            print(f"No path exists between {start} and {end}")
+            return None, None, [start]
         return bfs(self.graph, start, end, verbose)
 
     def dfs(self, start, end, verbose=False):
         """Use external DFS implementation"""
+        if self._known_no_path(start, end):
+            if verbose:
+                self._print_skipped_search(start)
+            return None, None, [start]
         return dfs(self.graph, start, end, verbose=verbose)
 
+    def k_shortest_paths(self, start, end, k=3, workers=None):
+        """Use external Yen implementation (the graph is never modified)"""
+        if self._known_no_path(start, end):
+            print(f"No path exists between {start} and {end}")
+            return []
+        # Same O(1) guard as the reachability index; edge or weight edits need invalidate_caches()
+        if self.graph.number_of_nodes() != self._path_cache_nodes:
+            self._path_cache = {}
+            self._path_cache_nodes = self.graph.number_of_nodes()
+            self._close_spur_pool()
+        # The worker pool is started once and reused by later queries on the same graph
+        if workers and workers > 1 and k > 1:
+            if self._spur_pool is None or self._spur_pool_workers != workers:
+                self._close_spur_pool()
+                self._spur_pool = start_spur_pool(self.graph, workers)
+                self._spur_pool_workers = workers
+        return k_shortest_paths(self.graph, start, end, k, cache=self._path_cache,
+                                executor=self._spur_pool if workers and workers > 1 else None)
+
     def display(self, path=None, show_weights=True):
         """Basic display method for compatibility"""
         self.visualize(path, show_weights)
@@ -152,6 +248,28 @@ def handle_pathfinding_choice(g, algorithm_method, algorithm_name):
     else:
         print("Invalid nodes! Please enter nodes from: A, B, C, D, E")
 
+def handle_k_shortest_choice(g):
+    """Helper function to handle k-shortest paths queries"""
+    start = input("Enter start node: ").upper()
+    end = input("Enter end node: ").upper()
+    
+    if start in g.graph.nodes() and end in g.graph.nodes():
+        k = input("How many paths (default 3): ")
+        k = int(k) if k.isdigit() and int(k) > 0 else 3
+        
+        show_viz = input("Show visualization of each path? (y/n): ").lower() == 'y'
+        
+        clear_screen()
+        paths = g.k_shortest_paths(start, end, k)
+        
+        if not paths:
+            print("No path found or algorithm returned no result.")
+        elif show_viz:
+            for path, _ in paths:
+                g.display(path)
+    else:
+        print("Invalid nodes! Please enter nodes from: A, B, C, D, E")
+
 def show_additional_methods_menu(g):
     """Show sub-menu for additional methods"""
     while True:
@@ -160,7 +278,8 @@ def show_additional_methods_menu(g):
         print("1. BFS (Breadth-First Search)")
         print("2. DFS (Depth-First Search)")
         print("3. Dijkstra with Table")
-        print("4. Back to Main Menu")
+        print("4. K-Shortest Paths (Yen)")
+        print("5. Back to Main Menu")
         
         sub_choice = input("Enter your choice (1-5): ")
         
@@ -181,6 +300,11 @@ def show_additional_methods_menu(g):
                 wait_for_user()
 
             case '4':
+                clear_screen()
+                handle_k_shortest_choice(g)
+                wait_for_user()
+
+            case '5':
                 clear_screen()
                 break
             
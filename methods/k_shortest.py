@@ -0,0 +1,228 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+
+def _edge_weight(graph, u, v):
+    return graph[u][v].get('weight', 1)
+
+def _distances_to(graph, end):
+    """
+    Dijkstra run backwards from end, giving the shortest-path tree towards end
+    Args:
+        graph: NetworkX graph object
+        end: target node
+    Returns:
+        tuple: (distances, next_hop) where next_hop[node] is the next node on a shortest path to end
+    """
+    incoming = graph.predecessors if graph.is_directed() else graph.neighbors
+    distances = {end: 0}
+    next_hop = {}
+    visited = set()
+
+    pq = [(0, end)]
+
+    while pq:
+        current_distance, current_node = heapq.heappop(pq)
+
+        if current_node in visited:
+            continue
+
+        visited.add(current_node)
+
+        for neighbor in incoming(current_node):
+            if neighbor not in visited:
+                distance = current_distance + _edge_weight(graph, neighbor, current_node)
+
+                if distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = distance
+                    next_hop[neighbor] = current_node
+                    heapq.heappush(pq, (distance, neighbor))
+
+    return distances, next_hop
+
+def _spur_search(graph, spur, end, blocked_nodes, blocked_edges, heuristic):
+    """
+    A* search from spur to end that ignores blocked nodes and edges (the graph is never modified)
+    Args:
+        graph: NetworkX graph object
+        spur: node the search starts from
+        end: target node
+        blocked_nodes: nodes that may not be visited
+        blocked_edges: (u, v) edges that may not be used
+        heuristic: distances to end in the full graph, a lower bound once things are blocked
+    Returns:
+        tuple: (path, distance) or (None, None) if no path exists
+    """
+    if spur not in heuristic:
+        return None, None
+
+    distances = {spur: 0}
+    previous = {}
+    visited = set()
+
+    pq = [(heuristic[spur], 0, spur)]
+
+    while pq:
+        _, current_distance, current_node = heapq.heappop(pq)
+
+        if current_node in visited:
+            continue
+
+        visited.add(current_node)
+
+        if current_node == end:
+            break
+
+        for neighbor in graph.neighbors(current_node):
+            if (neighbor in visited or neighbor in blocked_nodes or neighbor not in heuristic
+                    or (current_node, neighbor) in blocked_edges):
+                continue
+
+            distance = current_distance + _edge_weight(graph, current_node, neighbor)
+
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                previous[neighbor] = current_node
+                heapq.heappush(pq, (distance + heuristic[neighbor], distance, neighbor))
+
+    if end not in visited:
+        return None, None
+
+    path = []
+    current = end
+    while current is not None:
+        path.append(current)
+        current = previous.get(current)
+    path.reverse()
+
+    return path, distances[end]
+
+# The graph is handed to each worker process once, when the pool starts
+_worker_state = {}
+
+def _init_worker(graph):
+    _worker_state['graph'] = graph
+    _worker_state['trees'] = {}
+
+def _worker_spur_search(task):
+    end, spur, blocked_nodes, blocked_edges = task
+    graph = _worker_state['graph']
+    trees = _worker_state['trees']
+    # Each worker builds the tree towards end itself, so tasks stay small
+    if end not in trees:
+        trees[end] = _distances_to(graph, end)
+    return _spur_search(graph, spur, end, blocked_nodes, blocked_edges, trees[end][0])
+
+def start_spur_pool(graph, workers):
+    """
+    Start a process pool for spur searches that can be reused across queries
+    Args:
+        graph: NetworkX graph object, copied into every worker once
+        workers: number of worker processes
+    Returns:
+        ProcessPoolExecutor: only valid while the graph is unchanged
+    """
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(graph,))
+
+def k_shortest_paths(graph, start, end, k, workers=None, cache=None, executor=None):
+    """
+    Yen's algorithm for the k shortest loopless paths
+    Args:
+        graph: NetworkX graph object (not modified)
+        start: starting node
+        end: ending node
+        k: number of paths to find
+        workers: if greater than 1 and no executor is given, run the spur searches of each round
+                 in a process pool that is started on the first spur round and closed afterwards
+        cache: optional dict of shortest-path trees reused between calls on the same, unchanged graph
+        executor: optional pool from start_spur_pool(graph, ...) to reuse across calls, which
+                  avoids starting processes and copying the graph on every query
+    Returns:
+        list: [(path, total_distance), ...] ordered by distance, empty if no path exists
+    """
+    if start not in graph.nodes() or end not in graph.nodes():
+        print(f"Start node '{start}' or end node '{end}' not in graph")
+        return []
+
+    if k < 1:
+        return []
+
+    if cache is None:
+        cache = {}
+
+    # Shortest-path tree towards end: gives the first path and the A* heuristic for every spur
+    tree_key = ('tree', end)
+    if tree_key not in cache:
+        cache[tree_key] = _distances_to(graph, end)
+    heuristic, next_hop = cache[tree_key]
+
+    if start not in heuristic:
+        print(f"No path exists between {start} and {end}")
+        return []
+
+    path = [start]
+    while path[-1] != end:
+        path.append(next_hop[path[-1]])
+    shortest = [(path, heuristic[start])]
+
+    candidates = []
+    seen = {tuple(path)}
+    # Spur searches only live for this query, so the shared cache stays small
+    spur_cache = {}
+
+    own_pool = None
+
+    try:
+        while len(shortest) < k:
+            previous_path = shortest[-1][0]
+
+            # Prefix sums of the previous path give each root path's distance
+            root_distances = [0]
+            for i in range(len(previous_path) - 1):
+                root_distances.append(root_distances[-1] + _edge_weight(graph, previous_path[i], previous_path[i + 1]))
+
+            tasks = []
+            for i in range(len(previous_path) - 1):
+                root = previous_path[:i + 1]
+                blocked_edges = set()
+                for accepted_path, _ in shortest:
+                    if accepted_path[:i + 1] == root:
+                        blocked_edges.add((accepted_path[i], accepted_path[i + 1]))
+                        if not graph.is_directed():
+                            blocked_edges.add((accepted_path[i + 1], accepted_path[i]))
+                tasks.append((previous_path[i], frozenset(root[:-1]), frozenset(blocked_edges)))
+
+            # Only the main process fills the cache, so each search runs once
+            pending = [task for task in dict.fromkeys(tasks) if task not in spur_cache]
+            if pending and executor is None and workers and workers > 1 and own_pool is None:
+                own_pool = start_spur_pool(graph, workers)
+            pool = executor or own_pool
+            if pending and pool:
+                results = pool.map(_worker_spur_search, [(end,) + task for task in pending])
+            else:
+                results = (_spur_search(graph, task[0], end, task[1], task[2], heuristic) for task in pending)
+            spur_cache.update(zip(pending, results))
+
+            for i, task in enumerate(tasks):
+                spur_path, spur_distance = spur_cache[task]
+                if spur_path is None:
+                    continue
+                candidate = previous_path[:i] + spur_path
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(candidates, (root_distances[i] + spur_distance, candidate))
+
+            if not candidates:
+                break
+
+            distance, candidate = heapq.heappop(candidates)
+            shortest.append((candidate, distance))
+    finally:
+        if own_pool:
+            own_pool.shutdown()
+
+    for rank, (path, distance) in enumerate(shortest, start=1):
+        print(f"Path {rank} from {start} to {end}: {' -> '.join(map(str, path))} (distance: {distance})")
+    if len(shortest) < k:
+        print(f"Only {len(shortest)} loopless path(s) exist between {start} and {end}")
+
+    return shortest
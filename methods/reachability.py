@@ -0,0 +1,57 @@
+import networkx as nx
+
+def build_reachability_index(graph):
+    """
+    Build a reachability index for a directed graph
+    Strongly connected components are condensed into a DAG, then every
+    component gets a bitset label holding all components it can reach.
+    Args:
+        graph: NetworkX DiGraph object
+    Returns:
+        dict: {'component': {node: component_id}, 'reach': {component_id: bitset},
+               'nodes': number_of_nodes}
+    """
+    condensed = nx.condensation(graph)
+    component = condensed.graph['mapping']
+    reach = {}
+
+    # Visit components in reverse topological order so successors are labelled first
+    for comp in reversed(list(nx.topological_sort(condensed))):
+        bits = 1 << comp
+        for successor in condensed.successors(comp):
+            bits |= reach[successor]
+        reach[comp] = bits
+
+    return {
+        'component': component,
+        'reach': reach,
+        'nodes': graph.number_of_nodes(),
+    }
+
+def is_index_stale(index, graph):
+    """
+    Check whether nodes were added or removed since the index was built
+    Only the node count is compared, because counting edges in NetworkX walks
+    every node; edge edits must drop the index instead (Graf.invalidate_caches)
+    Args:
+        index: reachability index from build_reachability_index
+        graph: NetworkX DiGraph object
+    Returns:
+        bool: True if the index must be rebuilt
+    """
+    return index is None or index['nodes'] != graph.number_of_nodes()
+
+def can_reach(index, start, end):
+    """
+    Answer "is there a path from start to end" using the index
+    Args:
+        index: reachability index from build_reachability_index
+        start: starting node
+        end: ending node
+    Returns:
+        bool: True if end is reachable from start, False otherwise
+    """
+    component = index['component']
+    if start not in component or end not in component:
+        return False
+    return bool(index['reach'][component[start]] >> component[end] & 1)
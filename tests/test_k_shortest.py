@@ -0,0 +1,115 @@
+import itertools
+import random
+
+import networkx as nx
+
+from main import Graf, create_directed_graph, create_undirected_graph
+from methods.k_shortest import k_shortest_paths, start_spur_pool
+
+def random_graf(seed):
+    rng = random.Random(seed)
+    directed = rng.random() < 0.5
+    g = Graf(directed=directed)
+    for node in range(9):
+        g.add_node(str(node))
+    for u, v in nx.gnp_random_graph(9, 0.35, seed=seed, directed=directed).edges():
+        g.add_edge(str(u), str(v), weight=rng.randint(1, 9))
+    return g
+
+def reference_distances(graph, start, end, k):
+    try:
+        paths = itertools.islice(nx.shortest_simple_paths(graph, start, end, weight='weight'), k)
+        return [nx.path_weight(graph, path, 'weight') for path in paths]
+    except nx.NetworkXNoPath:
+        return []
+
+def test_matches_networkx_on_random_graphs():
+    for seed in range(150):
+        g = random_graf(seed)
+        result = g.k_shortest_paths('0', '8', 6)
+        assert [distance for _, distance in result] == reference_distances(g.graph, '0', '8', 6)
+        for path, distance in result:
+            assert len(set(path)) == len(path)
+            assert nx.path_weight(g.graph, path, 'weight') == distance
+        assert len({tuple(path) for path, _ in result}) == len(result)
+
+def test_process_pool_gives_same_result():
+    for seed in range(5):
+        g = random_graf(seed)
+        assert k_shortest_paths(g.graph, '0', '8', 5, workers=2) == k_shortest_paths(g.graph, '0', '8', 5)
+
+def test_shared_pool_gives_same_result():
+    g = random_graf(1)
+    with start_spur_pool(g.graph, 2) as executor:
+        for end in ['5', '7', '8']:
+            expected = k_shortest_paths(g.graph, '0', end, 5)
+            assert k_shortest_paths(g.graph, '0', end, 5, executor=executor) == expected
+
+def test_graf_reuses_pool_until_graph_changes():
+    g = create_undirected_graph()
+    g.k_shortest_paths('A', 'G', 3, workers=2)
+    pool = g._spur_pool
+    assert g.k_shortest_paths('B', 'F', 3, workers=2) == g.k_shortest_paths('B', 'F', 3)
+    assert g._spur_pool is pool
+    g.add_edge('A', 'G', weight=1)
+    assert g._spur_pool is None
+    assert g.k_shortest_paths('A', 'G', 1, workers=2) == [(['A', 'G'], 1)]
+
+def test_no_pool_without_spur_round(monkeypatch):
+    import methods.k_shortest
+
+    def fail(*args, **kwargs):
+        raise AssertionError("pool started")
+
+    monkeypatch.setattr(methods.k_shortest, 'ProcessPoolExecutor', fail)
+    g = create_undirected_graph()
+    assert g.k_shortest_paths('A', 'G', 1, workers=4) == [(['A', 'B', 'D', 'G'], 8)]
+
+def test_non_string_nodes():
+    g = Graf(directed=True)
+    g.add_directed_edge(1, 2)
+    assert g.k_shortest_paths(1, 2, workers=2) == [([1, 2], 1)]
+
+def test_graph_is_not_modified():
+    g = create_undirected_graph()
+    before = sorted(g.graph.edges(data=True))
+    g.k_shortest_paths('A', 'G', 5)
+    assert sorted(g.graph.edges(data=True)) == before
+
+def test_sample_graph_paths():
+    g = create_undirected_graph()
+    result = g.k_shortest_paths('A', 'G', 3)
+    assert result == [(['A', 'B', 'D', 'G'], 8), (['A', 'C', 'F', 'G'], 9), (['A', 'B', 'E', 'F', 'G'], 13)]
+
+def test_k_below_one_returns_nothing():
+    g = create_undirected_graph()
+    assert g.k_shortest_paths('A', 'G', 0) == []
+    assert g.k_shortest_paths('A', 'G', -1) == []
+
+def test_no_path_on_directed_graph():
+    g = create_directed_graph()
+    assert g.k_shortest_paths('F', 'A') == []
+
+def test_invalidate_caches_after_weight_change():
+    g = create_undirected_graph()
+    g.k_shortest_paths('A', 'G', 2)
+    g.graph['D']['G']['weight'] = 100
+    g.invalidate_caches()
+    assert g.k_shortest_paths('A', 'G', 1) == [(['A', 'C', 'F', 'G'], 9)]
+
+def test_invalidate_caches_after_edge_swap():
+    g = create_undirected_graph()
+    g.k_shortest_paths('A', 'G', 3)
+    g.graph.remove_edge('D', 'G')
+    g.graph.add_edge('A', 'G', weight=20)
+    g.invalidate_caches()
+    result = g.k_shortest_paths('A', 'G', 3)
+    assert [distance for _, distance in result] == reference_distances(g.graph, 'A', 'G', 3)
+    for path, _ in result:
+        assert all(g.graph.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+def test_cache_keeps_only_trees_between_queries():
+    g = create_undirected_graph()
+    g.k_shortest_paths('A', 'G', 5)
+    g.k_shortest_paths('B', 'F', 5)
+    assert set(g._path_cache) == {('tree', 'G'), ('tree', 'F')}
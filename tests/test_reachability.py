@@ -0,0 +1,86 @@
+import random
+
+import networkx as nx
+
+from main import Graf, create_directed_graph
+from methods.reachability import build_reachability_index, can_reach
+
+def test_index_matches_networkx_on_random_graphs():
+    for seed in range(100):
+        graph = nx.gnp_random_graph(10, 0.15, seed=seed, directed=True)
+        index = build_reachability_index(graph)
+        for start in graph.nodes():
+            for end in graph.nodes():
+                assert can_reach(index, start, end) == nx.has_path(graph, start, end)
+
+def test_has_path_on_sample_graph():
+    g = create_directed_graph()
+    assert g.has_path('A', 'F')
+    assert not g.has_path('F', 'A')
+    assert not g.has_path('A', 'Z')
+
+def test_negative_result_skips_search():
+    g = create_directed_graph()
+    assert g.bfs('F', 'A') == (None, None, ['F'])
+    assert g.dfs('F', 'A') == (None, None, ['F'])
+    assert g.dijkstra('F', 'A') == (None, None)
+
+def test_add_directed_edge_updates_index():
+    g = create_directed_graph()
+    assert not g.has_path('F', 'A')
+    g.add_directed_edge('F', 'A')
+    assert g.has_path('F', 'A')
+    assert g.has_path('E', 'B')
+
+def test_add_edge_on_directed_graph_updates_index():
+    g = create_directed_graph()
+    assert not g.has_path('F', 'A')
+    g.add_edge('F', 'A')
+    assert g.has_path('F', 'A')
+
+def test_add_node_updates_index():
+    g = create_directed_graph()
+    assert not g.has_path('A', 'G')
+    g.add_node('G')
+    g.add_directed_edge('F', 'G')
+    assert g.has_path('A', 'G')
+
+def test_direct_edit_adding_node_rebuilds_index():
+    g = create_directed_graph()
+    assert not g.has_path('A', 'G')
+    g.graph.add_edge('F', 'G')
+    assert g.has_path('A', 'G')
+
+def test_invalidate_caches_after_direct_edit():
+    g = create_directed_graph()
+    assert not g.has_path('F', 'A')
+    g.graph.remove_edge('E', 'F')
+    g.graph.add_edge('F', 'A')
+    g.invalidate_caches()
+    assert g.has_path('F', 'A') == nx.has_path(g.graph, 'F', 'A')
+    path, steps, _ = g.bfs('F', 'A')
+    assert path == ['F', 'A'] and steps == 1
+
+def test_random_edits_stay_consistent():
+    rng = random.Random(0)
+    g = Graf(directed=True)
+    for node in range(8):
+        g.add_node(node)
+    for _ in range(200):
+        u, v = rng.randrange(8), rng.randrange(8)
+        if g.graph.has_edge(u, v):
+            g.graph.remove_edge(u, v)
+        else:
+            g.graph.add_edge(u, v)
+        g.invalidate_caches()
+        start, end = rng.randrange(8), rng.randrange(8)
+        assert g.has_path(start, end) == nx.has_path(g.graph, start, end)
+
+def test_skipped_search_keeps_output(capsys):
+    g = create_directed_graph()
+    g.dfs('F', 'A')
+    assert capsys.readouterr().out == ''
+    g.bfs('F', 'A', verbose=True)
+    out = capsys.readouterr().out
+    assert 'Nodes visited: F' in out
+    assert 'No path exists between F and A' in out